@@ -0,0 +1,2 @@
+# conftest.py
+# Lets the tests under tests/ import the top-level modules (sweep, derivatives, ...)
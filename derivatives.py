@@ -0,0 +1,256 @@
+# derivatives.py
+"""Numerical derivatives of black-box functions, vectorized over evaluation points.
+
+`f` must be elementwise: it receives a 1-D NumPy array of x values and returns
+an array of the same length (use np.where for piecewise definitions).
+Complex-step additionally needs f to accept complex input and be analytic
+near x, so no abs/max/comparisons on x.
+
+Usage: python derivatives.py   (accuracy vs evaluation-count benchmark)
+"""
+from dataclasses import dataclass
+
+import numpy as np
+
+EPS = np.finfo(float).eps
+
+# f is assumed accurate to a few ulps; rounding bounds are scaled by this
+ROUNDING_ULPS = 8
+
+# Largest relative step Richardson starts from
+MAX_STEP = 0.25
+
+# How far the tableau's shrink factor may stray from ratio^(2k+2) before a point is
+# treated as non-smooth
+SHRINK_TOLERANCE = 1.25
+
+METHODS = ('auto', 'complex-step', 'richardson', 'central')
+
+
+@dataclass
+class Derivative:
+    """Derivative estimates, their error estimates and function evaluations per point"""
+    value: np.ndarray
+    error: np.ndarray
+    evaluations: int
+
+
+def _scale(x):
+    return np.maximum(np.abs(x), 1.0)
+
+
+def _exact_step(x, h):
+    # Make x + h exactly representable so the divisor matches the step actually taken
+    return (x + h) - x
+
+
+def _evaluate(f, points):
+    """Call f once on a stacked grid of points and restore its shape"""
+    return np.asarray(f(points.ravel())).reshape(points.shape)
+
+
+def central_step(x):
+    """Step that balances truncation (h²) against rounding (eps/h) error for central differences"""
+    return np.cbrt(3 * EPS) * _scale(np.asarray(x, dtype=float))
+
+
+def _rounding(f_plus, f_minus, h, scale):
+    # f can cancel to near zero while its terms stay large; |f'|·scale tracks their size
+    slope = np.abs(f_plus - f_minus) / (2 * h)
+    magnitude = np.maximum(np.maximum(np.abs(f_plus), np.abs(f_minus)), slope * scale)
+    return ROUNDING_ULPS * EPS * magnitude / h
+
+
+def central_difference(f, x, h=None):
+    """Central difference at step h, with truncation estimated from a second difference at 2h"""
+    x = np.asarray(x, dtype=float)
+    flat = x.ravel()
+    h = _exact_step(flat, central_step(flat) if h is None else h)
+    h2 = _exact_step(flat, 2 * h)
+    f_plus, f_minus, f_plus2, f_minus2 = _evaluate(f, np.stack([flat + h, flat - h, flat + h2, flat - h2]))
+    value = (f_plus - f_minus) / (2 * h)
+    coarse = (f_plus2 - f_minus2) / (2 * h2)
+    # Truncation is c·h², so D(2h) - D(h) ≈ 3c·h²
+    error = np.abs(coarse - value) / 3 + _rounding(f_plus, f_minus, h, _scale(flat))
+    return Derivative(value.reshape(x.shape), error.reshape(x.shape), 4)
+
+
+def richardson(f, x, levels=4, h0=None, ratio=2.0):
+    """Central differences at `levels` shrinking steps, extrapolated with a Neville tableau
+
+    Each point keeps the tableau entry with the smallest error estimate, so the
+    effective step size is chosen automatically per point.
+    """
+    x = np.asarray(x, dtype=float)
+    flat = x.ravel()
+    # The corner entry T[L-1][L-1] can only be compared with entries of its own order,
+    # which share its bias when the series converges slowly, so it is never chosen
+    top = max(levels - 2, 1)
+    if h0 is None:
+        # Finest step near the optimum for the highest order used, coarsest capped to stay local
+        h0 = min(EPS ** (1 / (2 * top + 3)) * ratio ** (levels - 1), MAX_STEP) * _scale(flat)
+    steps = np.stack([_exact_step(flat, h0 / ratio**i) for i in range(levels)])
+    values = _evaluate(f, np.concatenate([flat + steps, flat - steps]))
+    f_plus, f_minus = values[:levels], values[levels:]
+    rounding = _rounding(f_plus, f_minus, steps, _scale(flat))
+
+    # tableau[i][k]: estimate from steps 0..i eliminating error terms up to h^(2k)
+    tableau = [[(f_plus[i] - f_minus[i]) / (2 * steps[i])] for i in range(levels)]
+    best = tableau[0][0]
+    best_error = np.full(flat.shape, np.inf)
+    for i in range(1, levels):
+        amplification = 1.0
+        for k in range(1, min(i, top) + 1):
+            factor = ratio ** (2 * k)
+            estimate = tableau[i][k - 1] + (tableau[i][k - 1] - tableau[i - 1][k - 1]) / (factor - 1)
+            tableau[i].append(estimate)
+            # Each extrapolation step can grow rounding by its coefficient sum 1 + 2/(factor - 1)
+            amplification *= 1 + 2 / (factor - 1)
+            error = np.maximum(np.abs(estimate - tableau[i][k - 1]),
+                               np.abs(estimate - tableau[i - 1][k - 1])) + amplification * rounding[i]
+            better = error < best_error
+            best = np.where(better, estimate, best)
+            best_error = np.where(better, error, best_error)
+    if levels == 1:
+        return Derivative(best.reshape(x.shape), rounding[0].reshape(x.shape), 2)
+
+    # Extrapolation assumes D(h) = f' + c₁h² + c₂h⁴ + ..., so differences down column k
+    # of the tableau shrink by ratio^(2k+2). Where they don't (a kink or singularity
+    # within reach of the steps) the tableau can agree with itself and still be wrong,
+    # so bound the error through the finest central difference instead: its spread from
+    # the coarser ones covers its own error whenever D converges at least linearly.
+    smooth = np.ones(flat.shape, dtype=bool)
+    for k in range(levels - 2):
+        column = np.stack([tableau[i][k] for i in range(k, levels)])
+        diffs = np.abs(np.diff(column, axis=0))
+        noise = 4 * rounding[k + 1:]
+        expected = ratio ** (2 * k + 2)
+        for i in range(len(diffs) - 1):
+            with np.errstate(divide='ignore', invalid='ignore'):
+                shrink = diffs[i] / diffs[i + 1]
+            resolved = diffs[i + 1] > noise[i + 1]
+            smooth &= ~resolved | ((shrink > expected / SHRINK_TOLERANCE) & (shrink < expected * SHRINK_TOLERANCE))
+    raw = np.stack([row[0] for row in tableau])
+    spread = np.max(np.abs(raw - raw[-1]), axis=0) + rounding[-1]
+    best_error = np.where(smooth, best_error, np.maximum(best_error, np.abs(best - raw[-1]) + spread))
+    return Derivative(best.reshape(x.shape), best_error.reshape(x.shape), 2 * levels)
+
+
+def complex_step(f, x, h=1e-20, h_probe=1e-3):
+    """f'(x) ≈ Im f(x + ih) / h, free of subtractive cancellation for analytic f
+
+    A second step h_probe·max(|x|, 1) measures the O(h²) truncation term, which
+    is then scaled down to h; rounding is bounded relative to |f| and |f'|.
+    """
+    x = np.asarray(x, dtype=float)
+    flat = x.ravel()
+    probe = h_probe * _scale(flat)
+    values = _evaluate(f, np.stack([flat + 1j * h, flat + 1j * probe]))
+    value = np.imag(values[0]) / h
+    coarse = np.imag(values[1]) / probe
+    truncation = np.abs(coarse - value) * (h / probe)**2
+    rounding = ROUNDING_ULPS * EPS * (np.abs(value) + np.abs(np.real(values[0])) / _scale(flat))
+    return Derivative(value.reshape(x.shape), (truncation + rounding).reshape(x.shape), 2)
+
+
+def from_samples(x, y):
+    """Natural cubic spline through (x, y) samples, usable as a black-box f
+
+    Segments are looked up by the real part of the input, so the spline accepts
+    complex input and complex-step returns its derivative exactly. Beyond the
+    data the end segments are extended, so steps near the ends stay smooth.
+    """
+    x = np.asarray(x, dtype=float)
+    y = np.asarray(y, dtype=float)
+    if x.ndim != 1 or x.shape != y.shape:
+        raise ValueError("x and y must be 1-D and the same length")
+    if len(x) < 3:
+        raise ValueError("At least 3 samples are needed")
+    if not (np.all(np.isfinite(x)) and np.all(np.isfinite(y))):
+        raise ValueError("Samples must be finite numbers")
+    if np.any(np.diff(x) <= 0):
+        raise ValueError("x values must be strictly increasing")
+
+    # Second derivatives m at the knots, zero at both ends
+    widths = np.diff(x)
+    slopes = np.diff(y) / widths
+    n = len(x)
+    system = np.zeros((n - 2, n - 2))
+    rows = np.arange(n - 2)
+    system[rows, rows] = 2 * (widths[:-1] + widths[1:])
+    system[rows[1:], rows[:-1]] = widths[1:-1]
+    system[rows[:-1], rows[1:]] = widths[1:-1]
+    m = np.zeros(n)
+    m[1:-1] = np.linalg.solve(system, 6 * np.diff(slopes))
+
+    # Segment i: y[i] + b·t + c·t² + d·t³ with t = x - x[i]
+    b = slopes - widths * (2 * m[:-1] + m[1:]) / 6
+    c = m[:-1] / 2
+    d = np.diff(m) / (6 * widths)
+
+    def spline(points):
+        points = np.asarray(points)
+        segment = np.clip(np.searchsorted(x, np.real(points), side='right') - 1, 0, n - 2)
+        t = points - x[segment]
+        return y[segment] + t * (b[segment] + t * (c[segment] + t * d[segment]))
+
+    return spline
+
+
+def derivative(f, x, method='auto', complex_safe=False):
+    """Differentiate f at every x; 'auto' uses complex-step when f allows it, else Richardson"""
+    if method == 'auto':
+        method = 'complex-step' if complex_safe else 'richardson'
+    if method == 'complex-step':
+        return complex_step(f, x)
+    if method == 'richardson':
+        return richardson(f, x)
+    if method == 'central':
+        return central_difference(f, x)
+    raise ValueError(f"Unknown differentiation method '{method}'")
+
+
+# Black-box test functions: (label, f, exact derivative, accepts complex input)
+BENCHMARK_FUNCTIONS = [
+    ("sin(x)·e^(-x/3)",
+     lambda x: np.sin(x) * np.exp(-x / 3),
+     lambda x: np.exp(-x / 3) * (np.cos(x) - np.sin(x) / 3),
+     True),
+    ("x⁵ - 3x",
+     lambda x: x**5 - 3 * x,
+     lambda x: 5 * x**4 - 3,
+     True),
+    ("piecewise x² | 2x - 1",
+     lambda x: np.where(np.real(x) < 1, x**2, 2 * x - 1),
+     lambda x: np.where(x < 1, 2 * x, 2.0),
+     True),
+    ("|x|^2.5",
+     lambda x: np.abs(x)**2.5,
+     lambda x: 2.5 * np.sign(x) * np.abs(x)**1.5,
+     False),
+]
+
+
+def main():
+    x = np.linspace(-3, 3, 5000)
+    candidates = [("central", lambda f: central_difference(f, x))]
+    candidates += [(f"richardson L={levels}", lambda f, levels=levels: richardson(f, x, levels))
+                   for levels in (2, 3, 4, 6)]
+    candidates += [("complex-step", lambda f: complex_step(f, x))]
+
+    print(f"{len(x):,} points per function; errors are |estimate - exact|")
+    print(f"{'Function':<24}{'Method':<18}{'Evals/pt':>9}{'Median err':>12}{'Max err':>12}{'Est. covers':>13}")
+    for label, f, exact, complex_ok in BENCHMARK_FUNCTIONS:
+        truth = exact(x)
+        for name, run in candidates:
+            if name == "complex-step" and not complex_ok:
+                continue
+            result = run(f)
+            actual = np.abs(result.value - truth)
+            covered = np.mean(actual <= result.error)
+            print(f"{label:<24}{name:<18}{result.evaluations:>9}"
+                  f"{np.median(actual):>12.1e}{actual.max():>12.1e}{100 * covered:>12.0f}%")
+
+
+if __name__ == "__main__":
+    main()
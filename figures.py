@@ -0,0 +1,190 @@
+# figures.py
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+import numpy as np
+import math
+
+plt.style.use('default')
+
+
+def tangent_line_figure():
+    """Parabola f(x) = (x-1)² with its tangent at x = 2"""
+    fig, ax = plt.subplots(figsize=(4, 3), facecolor='white')
+    x = np.linspace(-2, 4, 100)
+    y = x**2 - 2*x + 1  # (x-1)^2
+    ax.plot(x, y, 'blue', linewidth=3, label='f(x) = (x-1)²')
+
+    # Tangent at x = 2
+    x_tan = 2
+    y_tan = (x_tan - 1)**2
+    slope = 2*(x_tan - 1)  # derivative
+    x_line = np.linspace(0, 4, 100)
+    y_line = slope * (x_line - x_tan) + y_tan
+    ax.plot(x_line, y_line, 'red', linewidth=2, label=f'Tangent at x={x_tan}')
+    ax.plot(x_tan, y_tan, 'ro', markersize=8)
+
+    ax.set_xlim(-0.5, 4)
+    ax.set_ylim(-0.5, 4)
+    ax.grid(True, alpha=0.3)
+    ax.legend()
+    ax.set_title('Tangent Line to Curve', fontweight='bold')
+    return fig
+
+
+def circle_tangent_figure():
+    """Circle x² + y² = 4 with its tangent at (√2, √2)"""
+    fig, ax = plt.subplots(figsize=(4, 3), facecolor='white')
+    theta = np.linspace(0, 2*np.pi, 100)
+    x_circle = 2 * np.cos(theta)
+    y_circle = 2 * np.sin(theta)
+    ax.plot(x_circle, y_circle, 'purple', linewidth=3, label='Circle: x² + y² = 4')
+
+    # Tangent at point (√2, √2)
+    x_point = math.sqrt(2)
+    y_point = math.sqrt(2)
+    ax.plot(x_point, y_point, 'ro', markersize=8, label=f'Point ({x_point:.2f}, {y_point:.2f})')
+
+    # Tangent line (perpendicular to radius)
+    x_tan_line = np.linspace(-1, 3, 100)
+    y_tan_line = -x_tan_line + 2*math.sqrt(2)  # slope = -x/y at point
+    ax.plot(x_tan_line, y_tan_line, 'red', linewidth=2, label='Tangent Line')
+
+    ax.set_xlim(-3, 3)
+    ax.set_ylim(-3, 3)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=8)
+    ax.set_title('Tangent to Circle', fontweight='bold')
+    return fig
+
+
+def derivative_figure():
+    """f(x) = x³ - 3x side by side with its derivative"""
+    fig, (ax1, ax2) = plt.subplots(1, 2, figsize=(8, 3), facecolor='white')
+
+    # Original function
+    x = np.linspace(-3, 3, 100)
+    y = x**3 - 3*x
+    ax1.plot(x, y, 'green', linewidth=3, label='f(x) = x³ - 3x')
+    ax1.set_title('Original Function', fontweight='bold')
+    ax1.grid(True, alpha=0.3)
+    ax1.legend()
+
+    # Derivative
+    y_prime = 3*x**2 - 3
+    ax2.plot(x, y_prime, 'orange', linewidth=3, label="f'(x) = 3x² - 3")
+    ax2.axhline(y=0, color='black', linestyle='--', alpha=0.5)
+    ax2.set_title('Derivative (Slope Function)', fontweight='bold')
+    ax2.grid(True, alpha=0.3)
+    ax2.legend()
+
+    fig.tight_layout()
+    return fig
+
+
+def normal_line_figure():
+    """f(x) = ½x² with tangent and normal lines at x = 2"""
+    fig, ax = plt.subplots(figsize=(4, 3), facecolor='white')
+    x = np.linspace(-1, 3, 100)
+    y = 0.5 * x**2
+    ax.plot(x, y, 'navy', linewidth=3, label='f(x) = ½x²')
+
+    # Point and tangent
+    x_point = 2
+    y_point = 0.5 * x_point**2
+    slope_tangent = x_point  # derivative at x=2
+    slope_normal = -1/slope_tangent
+
+    x_line = np.linspace(-1, 3, 100)
+    y_tangent = slope_tangent * (x_line - x_point) + y_point
+    y_normal = slope_normal * (x_line - x_point) + y_point
+
+    ax.plot(x_line, y_tangent, 'red', linewidth=2, label='Tangent Line')
+    ax.plot(x_line, y_normal, 'magenta', linewidth=2, label='Normal Line')
+    ax.plot(x_point, y_point, 'ko', markersize=8)
+
+    ax.set_xlim(-0.5, 3)
+    ax.set_ylim(-1, 3)
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=8)
+    ax.set_title('Tangent vs Normal Lines', fontweight='bold')
+    return fig
+
+
+def ellipse_tangent_figure():
+    """Ellipse x²/9 + y²/4 = 1 with its tangent at t = π/4 and both foci"""
+    fig, ax = plt.subplots(figsize=(4, 3), facecolor='white')
+
+    # Create ellipse: x²/9 + y²/4 = 1 (a=3, b=2)
+    theta = np.linspace(0, 2*np.pi, 100)
+    a, b = 3, 2
+    x_ellipse = a * np.cos(theta)
+    y_ellipse = b * np.sin(theta)
+    ax.plot(x_ellipse, y_ellipse, 'darkorange', linewidth=3, label='Ellipse: x²/9 + y²/4 = 1')
+
+    # Point on ellipse at parameter t = π/4
+    t = math.pi/4
+    x_point = a * math.cos(t)
+    y_point = b * math.sin(t)
+    ax.plot(x_point, y_point, 'ro', markersize=8, label=f'Point ({x_point:.2f}, {y_point:.2f})')
+
+    # Tangent line slope: dy/dx = -(b²x)/(a²y)
+    if y_point != 0:
+        slope = -(b**2 * x_point) / (a**2 * y_point)
+        x_tan_line = np.linspace(-1, 4, 100)
+        y_tan_line = slope * (x_tan_line - x_point) + y_point
+        ax.plot(x_tan_line, y_tan_line, 'red', linewidth=2, label='Tangent Line')
+
+    # Draw foci
+    c = math.sqrt(a**2 - b**2)  # focal distance
+    ax.plot(c, 0, 'bs', markersize=6, label='Foci')
+    ax.plot(-c, 0, 'bs', markersize=6)
+
+    ax.set_xlim(-4, 4)
+    ax.set_ylim(-3, 3)
+    ax.set_aspect('equal')
+    ax.grid(True, alpha=0.3)
+    ax.legend(fontsize=7)
+    ax.set_title('Tangent to Ellipse', fontweight='bold')
+    return fig
+
+
+# Gallery figures by image key
+GALLERY_FIGURES = {
+    'tangent_line': tangent_line_figure,
+    'circle_tangent': circle_tangent_figure,
+    'derivative': derivative_figure,
+    'normal_line': normal_line_figure,
+    'ellipse_tangent': ellipse_tangent_figure,
+}
+
+
+def sweep_figure(result, quantity, statistic, surface=False):
+    """Heatmap or surface of one sweep quantity over the two heatmap parameters"""
+    spec = result.spec
+    row_axis, col_axis = spec.axis(spec.rows), spec.axis(spec.cols)
+    data = result.statistic(quantity, statistic)
+    label = f"{statistic} {quantity}"
+
+    # Slopes blow up near vertical tangents, so scale colours to the central 96% of values
+    finite = data[np.isfinite(data)]
+    vmin, vmax = np.percentile(finite, [2, 98]) if finite.size else (None, None)
+
+    if surface:
+        fig = plt.figure(figsize=(6, 4.5), facecolor='white')
+        ax = fig.add_subplot(projection='3d')
+        X, Y = np.meshgrid(col_axis.values(), row_axis.values())
+        ax.plot_surface(X, Y, np.clip(data, vmin, vmax) if finite.size else data,
+                        cmap='viridis', vmin=vmin, vmax=vmax)
+        ax.set_zlabel(label)
+    else:
+        fig, ax = plt.subplots(figsize=(6, 4.5), facecolor='white')
+        image = ax.imshow(data, origin='lower', aspect='auto', cmap='viridis', vmin=vmin, vmax=vmax,
+                          extent=(col_axis.start, col_axis.stop, row_axis.start, row_axis.stop))
+        fig.colorbar(image, ax=ax, label=label)
+
+    ax.set_xlabel(spec.cols)
+    ax.set_ylabel(spec.rows)
+    ax.set_title(f"{spec.kind.capitalize()} sweep: {label}", fontweight='bold')
+    return fig
@@ -0,0 +1,229 @@
+# image_pipeline.py
+import functools
+import hashlib
+import html
+import importlib.util
+import io
+import json
+import os
+import re
+from dataclasses import dataclass
+
+from PIL import Image
+
+# Figures are drawn for dpi=100, i.e. about 400 CSS px for a 4-inch figure
+BASE_DPI = 100
+
+# Variants as multiples of that drawn width: 0.75 for narrow phones, 1 for 1x screens,
+# 1.5 for everything denser (effective DPR is capped there; beyond it nobody sees a difference)
+VARIANT_SCALES = (0.75, 1.0, 1.5)
+
+# Formats in order of preference; the browser picks the first <source> it supports
+VARIANT_FORMATS = ('image/webp', 'image/png')
+
+# Images are shown no wider than drawn. Streamlit stacks columns below 640px (with 1rem
+# padding per side), above that a gallery column is at most half the viewport
+GALLERY_SIZES = '(max-width: 640px) min(calc(100vw - 2rem), {width}px), min(50vw, {width}px)'
+
+# Where Streamlit serves files from when server.enableStaticServing is on
+STATIC_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'static')
+STATIC_URL = 'app/static'
+
+# Plots are flat colours plus anti-aliasing, so 64 colours are visually lossless
+PALETTE_COLORS = 64
+
+# Written next to the variants by `python image_report.py --export` at deploy time
+MANIFEST_NAME = 'gallery.json'
+
+_EXTENSIONS = {'image/png': 'png', 'image/webp': 'webp'}
+
+
+@dataclass(frozen=True)
+class ImageVariant:
+    """One encoded rendition of a figure drawn css_width CSS px wide"""
+    width: int
+    mime: str
+    data: bytes
+    css_width: int
+
+    @property
+    def digest(self):
+        """Content hash used in file names, so a changed figure always gets a new URL"""
+        return hashlib.sha256(self.data).hexdigest()[:16]
+
+    def filename(self, name):
+        return f"{name}-{self.width}w.{self.digest}.{_EXTENSIONS[self.mime]}"
+
+
+def baseline_png(fig):
+    """Encode a figure the way the app did originally (PNG at dpi=100)"""
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', facecolor='white', bbox_inches='tight', dpi=100)
+    return buf.getvalue()
+
+
+def _quantize(img):
+    return img.quantize(colors=PALETTE_COLORS, method=Image.Quantize.FASTOCTREE, dither=Image.Dither.NONE)
+
+
+def _encode_png(palette_img):
+    buf = io.BytesIO()
+    palette_img.save(buf, format='PNG', optimize=True)
+    return buf.getvalue()
+
+
+def _encode_webp(palette_img):
+    # Lossless WebP of the palette image beats lossy WebP on line art (no ringing, ~30% under PNG).
+    # method=6 saves under 1% more but takes ~100x longer, which the first gallery visit would pay
+    buf = io.BytesIO()
+    palette_img.save(buf, format='WEBP', lossless=True, quality=100, method=4)
+    return buf.getvalue()
+
+
+def render_variants(fig, scales=VARIANT_SCALES):
+    """Encode PNG and WebP variants of a figure at each scale of its dpi=100 size
+
+    The figure is rendered once, at the largest scale, and resized down for the others.
+    """
+    largest_scale = max(scales)
+    buf = io.BytesIO()
+    fig.savefig(buf, format='png', facecolor='white', bbox_inches='tight', dpi=BASE_DPI * largest_scale)
+    buf.seek(0)
+    master = Image.open(buf).convert('RGB')
+    css_width = round(master.width / largest_scale)
+
+    variants = []
+    for scale in sorted(scales):
+        img = master
+        if scale != largest_scale:
+            width = round(master.width * scale / largest_scale)
+            img = master.resize((width, round(master.height * width / master.width)), Image.Resampling.LANCZOS)
+        img = _quantize(img)
+        variants.append(ImageVariant(img.width, 'image/png', _encode_png(img), css_width))
+        variants.append(ImageVariant(img.width, 'image/webp', _encode_webp(img), css_width))
+    return variants
+
+
+def render_figure(build, scales=VARIANT_SCALES):
+    """Build a figure, render its variants and release it"""
+    # Imported here so pages that only load a built gallery never import matplotlib
+    import matplotlib.pyplot as plt
+    fig = build()
+    try:
+        return render_variants(fig, scales)
+    finally:
+        plt.close(fig)
+
+
+def select_variant(variants, slot_px, accepts_webp=True):
+    """Pick the variant a browser would download for a slot of slot_px device pixels
+
+    Mirrors srcset selection: the smallest candidate at least as wide as the slot,
+    falling back to the widest one available (which is what caps the effective DPR).
+    """
+    mime = 'image/webp' if accepts_webp else 'image/png'
+    candidates = sorted((v for v in variants if v.mime == mime), key=lambda v: v.width)
+    for variant in candidates:
+        if variant.width >= slot_px:
+            return variant
+    return candidates[-1]
+
+
+def publish_variants(name, variants, static_dir=STATIC_DIR):
+    """Write variants under content-hashed names and remove superseded ones for the same figure
+
+    Files that already exist are left untouched.
+    """
+    os.makedirs(static_dir, exist_ok=True)
+    current = set()
+    for variant in variants:
+        filename = variant.filename(name)
+        current.add(filename)
+        path = os.path.join(static_dir, filename)
+        if not os.path.exists(path):
+            tmp_path = path + '.tmp'
+            with open(tmp_path, 'wb') as f:
+                f.write(variant.data)
+            os.replace(tmp_path, path)
+    pattern = re.compile(rf"{re.escape(name)}-\d+w\.[0-9a-f]{{16}}\.({'|'.join(_EXTENSIONS.values())})(\.tmp)?")
+    for filename in os.listdir(static_dir):
+        if pattern.fullmatch(filename) and filename not in current:
+            try:
+                os.remove(os.path.join(static_dir, filename))
+            except OSError:
+                pass  # already removed by a concurrent publish
+
+
+@functools.lru_cache(maxsize=None)
+def gallery_salt():
+    """Hash of the figure and encoder source, so a gallery built from other code is ignored"""
+    digest = hashlib.sha256()
+    # figures.py is located, not imported, so checking a built gallery stays cheap
+    for path in (os.path.abspath(__file__), importlib.util.find_spec('figures').origin):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest()[:16]
+
+
+def publish_gallery(images, static_dir=STATIC_DIR):
+    """Publish every figure's variants and a manifest that load_gallery can serve them from"""
+    for name, variants in images.items():
+        publish_variants(name, variants, static_dir)
+    manifest = {
+        'salt': gallery_salt(),
+        'figures': {
+            name: [{'width': v.width, 'mime': v.mime, 'css_width': v.css_width, 'file': v.filename(name)}
+                   for v in variants]
+            for name, variants in images.items()
+        },
+    }
+    path = os.path.join(static_dir, MANIFEST_NAME)
+    tmp_path = path + '.tmp'
+    with open(tmp_path, 'w') as f:
+        json.dump(manifest, f, indent=1)
+    os.replace(tmp_path, path)
+
+
+def load_gallery(static_dir=STATIC_DIR):
+    """Variants published by publish_gallery, or None if missing, incomplete or built from other code"""
+    try:
+        with open(os.path.join(static_dir, MANIFEST_NAME)) as f:
+            manifest = json.load(f)
+        if manifest['salt'] != gallery_salt():
+            return None
+        images = {}
+        for name, entries in manifest['figures'].items():
+            images[name] = []
+            for entry in entries:
+                with open(os.path.join(static_dir, entry['file']), 'rb') as f:
+                    variant = ImageVariant(entry['width'], entry['mime'], f.read(), entry['css_width'])
+                if variant.filename(name) != entry['file']:
+                    return None
+                images[name].append(variant)
+        return images
+    except (OSError, ValueError, KeyError):
+        return None
+
+
+def picture_html(name, variants, caption, sizes=GALLERY_SIZES, url_prefix=STATIC_URL):
+    """<picture> markup letting the browser choose format and width"""
+    css_width = variants[0].css_width
+    sizes = sizes.format(width=css_width)
+    sources = []
+    for mime in VARIANT_FORMATS:
+        srcset = ', '.join(
+            f"{url_prefix}/{v.filename(name)} {v.width}w"
+            for v in variants if v.mime == mime
+        )
+        sources.append(f'<source type="{mime}" srcset="{srcset}" sizes="{sizes}">')
+    fallback = select_variant(variants, css_width, accepts_webp=False)
+    alt = html.escape(caption)
+    return f"""
+<figure style="margin: 0 0 1rem 0; text-align: center;">
+    <picture>
+        {''.join(sources)}
+        <img src="{url_prefix}/{fallback.filename(name)}" alt="{alt}" loading="lazy" style="width: 100%; max-width: {css_width}px; height: auto;">
+    </picture>
+    <figcaption style="font-size: 0.875rem; color: #808495;">{alt}</figcaption>
+</figure>
+"""
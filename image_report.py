@@ -0,0 +1,70 @@
+# image_report.py
+"""Bytes per gallery page view before and after the responsive image pipeline.
+
+With --export the variants and their manifest are also published, which is the
+deploy step that lets the gallery page skip rendering (default: static/).
+
+Usage: python image_report.py [--export [DIR]]
+"""
+import argparse
+
+from figures import GALLERY_FIGURES
+from image_pipeline import STATIC_DIR, baseline_png, render_variants, select_variant, publish_gallery
+import matplotlib.pyplot as plt
+
+# (label, viewport width in CSS px, device pixel ratio, WebP support)
+CLIENT_PROFILES = [
+    ("Small phone 320px @1x", 320, 1, True),
+    ("Phone 360px @2x", 360, 2, True),
+    ("Phone 390px @3x", 390, 3, True),
+    ("Tablet 820px @2x", 820, 2, True),
+    ("Projector 1024px @1x", 1024, 1, True),
+    ("Laptop 1366px @1x", 1366, 1, True),
+    ("Desktop 1920px @2x", 1920, 2, True),
+    ("Laptop 1366px @1x, no WebP", 1366, 1, False),
+]
+
+
+def slot_pixels(viewport, dpr, css_width):
+    """Device pixels the browser requests for a gallery image (mirrors GALLERY_SIZES)"""
+    slot = min(viewport - 32, css_width) if viewport <= 640 else min(viewport / 2, css_width)
+    return slot * dpr
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--export', metavar='DIR', nargs='?', const=STATIC_DIR,
+                        help="also publish the variants and their manifest to DIR (default: static/)")
+    args = parser.parse_args()
+
+    baseline = {}
+    variants = {}
+    for name, build in GALLERY_FIGURES.items():
+        fig = build()
+        baseline[name] = len(baseline_png(fig))
+        variants[name] = render_variants(fig)
+        plt.close(fig)
+    if args.export:
+        publish_gallery(variants, args.export)
+
+    before = sum(baseline.values())
+    print(f"{'Client':<30}{'Widths fetched':>16}{'Before':>10}{'After':>10}{'Saved':>7}")
+    for label, viewport, dpr, webp in CLIENT_PROFILES:
+        chosen = [select_variant(v, slot_pixels(viewport, dpr, v[0].css_width), webp) for v in variants.values()]
+        after = sum(len(v.data) for v in chosen)
+        widths = sorted({v.width for v in chosen})
+        fetched = f"{widths[0]}-{widths[-1]}px" if len(widths) > 1 else f"{widths[0]}px"
+        saved = 100 * (1 - after / before)
+        print(f"{label:<30}{fetched:>16}{before:>10,}{after:>10,}{saved:>6.0f}%")
+
+    print()
+    print(f"{'Variant sizes (bytes)':<24}{'0.75x':>9}{'1x':>9}{'1.5x':>9}")
+    for name, vs in variants.items():
+        for mime in ('image/png', 'image/webp'):
+            sizes = ''.join(f"{len(v.data):>9,}" for v in vs if v.mime == mime)
+            widths = '/'.join(str(v.width) for v in vs if v.mime == mime)
+            print(f"{name + ' ' + mime.split('/')[1]:<24}{sizes}   ({widths}px; baseline png {baseline[name]:,})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,16 @@
+# lesson_ui.py
+import streamlit as st
+
+
+def show_tangent_line(x_point, y_point, slope):
+    """Display point, slope and tangent line equation in point-slope and simplified form"""
+    st.success(f"**Point:** ({x_point}, {y_point:.2f})")
+    st.success(f"**Slope:** {slope:.2f}")
+    st.success(f"**Tangent Line:** y - {y_point:.2f} = {slope:.2f}(x - {x_point})")
+
+    # Simplified form
+    y_intercept = y_point - slope * x_point
+    if y_intercept >= 0:
+        st.info(f"**Simplified:** y = {slope:.2f}x + {y_intercept:.2f}")
+    else:
+        st.info(f"**Simplified:** y = {slope:.2f}x - {abs(y_intercept):.2f}")
@@ -0,0 +1,128 @@
+# page_timing.py
+"""Cold-start script time and heavy imports per lesson page, optionally against the old single-page app.
+
+Each script runs in a fresh interpreter (streamlit itself pre-imported, as it is
+in a running server), so the numbers include every import the page triggers.
+Times are for the full script run, cold and as a warm rerun. They say nothing
+about when the browser paints, which this does not measure.
+
+`--monolith` without a ref joins the current pages, in navigation order, into
+one script, which is the same code run as a single page. With a ref, that
+commit's app.py is checked out from git (with the modules it imported at the
+time) into a temporary directory. The option can be repeated.
+
+Usage:
+    python page_timing.py
+    python page_timing.py --monolith --monolith <git ref of the original app>
+"""
+import argparse
+import io
+import json
+import os
+import subprocess
+import sys
+import tarfile
+import tempfile
+
+ROOT = os.path.dirname(os.path.abspath(__file__))
+PAGES_DIR = os.path.join(ROOT, 'sections')
+
+# Page scripts in navigation order
+PAGES = [
+    'overview.py',
+    'gallery.py',
+    'calculators.py',
+    'problem_solver.py',
+    'ellipse.py',
+    'sweeps.py',
+    'quiz.py',
+    'resources.py',
+]
+
+HEAVY_MODULES = ('numpy', 'pandas', 'matplotlib', 'PIL')
+
+_CHILD = """
+import json, sys, time
+sys.path.insert(0, {root!r})
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+before = set(sys.modules)
+at = AppTest.from_file({path!r}, default_timeout=300)
+start = time.perf_counter()
+at.run()
+cold = time.perf_counter() - start
+start = time.perf_counter()
+at.run()
+warm = time.perf_counter() - start
+loaded = [m for m in {heavy!r} if m in sys.modules and m not in before]
+print(json.dumps({{'cold': cold, 'warm': warm, 'loaded': loaded, 'errors': len(at.exception)}}))
+"""
+
+
+def _git(*args):
+    result = subprocess.run(['git', *args], cwd=ROOT, capture_output=True)
+    if result.returncode:
+        raise SystemExit(result.stderr.decode().strip())
+    return result.stdout
+
+
+def join_pages(directory):
+    """Write the current pages, in navigation order, as one script and return its path"""
+    path = os.path.join(directory, 'monolith.py')
+    with open(path, 'w') as out:
+        for page in PAGES:
+            with open(os.path.join(PAGES_DIR, page)) as f:
+                out.write(f.read() + '\n')
+    return path
+
+
+def export_tree(ref, directory):
+    """Extract the repository at ref into directory and return the path of its app.py"""
+    archive = _git('archive', '--format=tar', ref)
+    with tarfile.open(fileobj=io.BytesIO(archive)) as tar:
+        tar.extractall(directory, filter='data')
+    return os.path.join(directory, 'app.py')
+
+
+def time_script(path, repeats=3, root=ROOT):
+    """Best-of-N cold and warm run times for one script, each cold run in a new interpreter"""
+    runs = []
+    for _ in range(repeats):
+        code = _CHILD.format(root=root, path=path, heavy=HEAVY_MODULES)
+        output = subprocess.run([sys.executable, '-c', code], cwd=root, capture_output=True,
+                                text=True, check=True).stdout
+        runs.append(json.loads(output.strip().splitlines()[-1]))
+    best = min(runs, key=lambda run: run['cold'])
+    best['warm'] = min(run['warm'] for run in runs)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time each lesson page from a cold start")
+    parser.add_argument('--monolith', metavar='REF', nargs='?', const='', action='append', default=[],
+                        help="also time a single-page app: app.py at this git ref, or without a ref "
+                             "the current pages joined into one script (repeatable)")
+    parser.add_argument('--repeats', type=int, default=3)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as workdir:
+        scripts = [(page, os.path.join(PAGES_DIR, page), ROOT) for page in PAGES]
+        for ref in args.monolith:
+            if not ref:
+                scripts.append(("monolith (current)", join_pages(workdir), ROOT))
+                continue
+            commit = _git('rev-parse', '--short', ref + '^{commit}').decode().strip()
+            checkout = os.path.join(workdir, commit)
+            scripts.append((f"monolith ({commit})", export_tree(commit, checkout), checkout))
+
+        print(f"{'Page':<24}{'Full script, cold (ms)':>24}{'Rerun (ms)':>12}  Heavy imports")
+        for label, path, root in scripts:
+            result = time_script(path, args.repeats, root)
+            loaded = ', '.join(result['loaded']) or '-'
+            errors = f"  ({result['errors']} exception(s))" if result['errors'] else ''
+            print(f"{label:<24}{1000 * result['cold']:>24.0f}{1000 * result['warm']:>12.0f}  {loaded}{errors}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,87 @@
+# calculators.py
+import streamlit as st
+import numpy as np
+from derivatives import BENCHMARK_FUNCTIONS, METHODS, derivative, from_samples
+from lesson_ui import show_tangent_line
+from tangency_math import quadratic_tangent
+
+# Interactive Tangent Calculator
+st.markdown("""
+### 🧮 Interactive Tangent Line Calculator
+Find the equation of the tangent line to any quadratic function at a given point.
+""")
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    a_coeff = st.number_input("Coefficient 'a'", value=1.0, step=0.1, help="For f(x) = ax² + bx + c")
+    b_coeff = st.number_input("Coefficient 'b'", value=0.0, step=0.1)
+    c_coeff = st.number_input("Coefficient 'c'", value=0.0, step=0.1)
+
+with col2:
+    x_point = st.number_input("x-coordinate of point", value=1.0, step=0.1)
+    
+with col3:
+    if st.button("🔍 Calculate Tangent"):
+        # Calculate y-coordinate and slope (derivative)
+        y_point, slope, _ = (float(v) for v in quadratic_tangent(a_coeff, b_coeff, c_coeff, x_point))
+        
+        # Display results
+        show_tangent_line(x_point, y_point, slope)
+
+# Numerical Tangent Calculator
+st.markdown("""
+### 🔢 Numerical Tangent Calculator
+Not every function has a derivative formula handy: piecewise definitions and measured data are
+"black boxes". Estimate the tangent numerically and compare the result with the exact slope.
+""")
+
+numeric_functions = {label: (f, exact, complex_ok) for label, f, exact, complex_ok in BENCHMARK_FUNCTIONS}
+PASTED_SAMPLES = "Pasted (x, y) samples"
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    numeric_label = st.selectbox("Black-box function", [*numeric_functions, PASTED_SAMPLES], key="numeric_function")
+    numeric_method = st.selectbox("Method", METHODS, key="numeric_method",
+                                  help="auto uses complex-step when the function allows it, otherwise Richardson extrapolation")
+
+with col2:
+    numeric_x = st.number_input("x-coordinate of point", value=0.5, step=0.1, key="numeric_x")
+
+samples_text = None
+if numeric_label == PASTED_SAMPLES:
+    samples_text = st.text_area(
+        "Samples, one 'x, y' pair per line",
+        value="0, 0\n0.5, 0.48\n1, 0.84\n1.5, 1.0\n2, 0.91\n2.5, 0.6\n3, 0.14",
+        help="The tangent is taken on a natural cubic spline through your points",
+        key="numeric_samples",
+    )
+
+with col3:
+    if st.button("🔢 Estimate Tangent"):
+        if samples_text is not None:
+            try:
+                pairs = [line.replace(',', ' ').split() for line in samples_text.splitlines() if line.strip()]
+                if any(len(pair) != 2 for pair in pairs):
+                    raise ValueError("Each line needs exactly one x and one y value")
+                sample_x, sample_y = np.array(pairs, dtype=float).reshape(-1, 2).T
+                numeric_f = from_samples(sample_x, sample_y)
+                if not sample_x[0] <= numeric_x <= sample_x[-1]:
+                    raise ValueError(f"x must lie within the samples ({sample_x[0]:g} to {sample_x[-1]:g})")
+            except ValueError as error:
+                st.error(f"Could not use the samples: {error}")
+            else:
+                estimate = derivative(numeric_f, numeric_x, numeric_method, complex_safe=True)
+                numeric_y = float(numeric_f(np.array([numeric_x]))[0])
+                show_tangent_line(numeric_x, numeric_y, float(estimate.value))
+                st.caption(f"Error estimate ±{float(estimate.error):.1e} against the spline from "
+                           f"{estimate.evaluations} function evaluation(s); no exact slope for measured data")
+        else:
+            numeric_f, numeric_exact, complex_ok = numeric_functions[numeric_label]
+            if numeric_method == 'complex-step' and not complex_ok:
+                st.warning("Complex-step needs a function that accepts complex input - try Richardson instead")
+            else:
+                estimate = derivative(numeric_f, numeric_x, numeric_method, complex_safe=complex_ok)
+                numeric_y = float(numeric_f(np.array([numeric_x]))[0])
+                show_tangent_line(numeric_x, numeric_y, float(estimate.value))
+                st.caption(f"Error estimate ±{float(estimate.error):.1e} from {estimate.evaluations} function "
+                           f"evaluation(s); exact slope {float(numeric_exact(numeric_x)):.6f}")
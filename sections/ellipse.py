@@ -0,0 +1,200 @@
+# ellipse.py
+import streamlit as st
+import math
+import pandas as pd
+from tangency_math import ellipse_tangent, focal_distance_error
+
+# Ellipse Tangency Deep Dive
+st.markdown("""
+### 🥚 Ellipse Tangency: Advanced Concepts
+
+Ellipses have fascinating tangency properties that connect geometry, algebra, and physics. Unlike circles, 
+ellipses have **two focal points** that create unique reflection properties crucial in astronomy, optics, and engineering.
+""")
+
+# Ellipse Tangency Theory
+col1, col2 = st.columns(2)
+
+with col1:
+    st.markdown("""
+    **🔸 Key Properties of Ellipse Tangents:**
+    
+    **1. Reflection Property**
+    - Any ray from one focus reflects off the ellipse and passes through the other focus
+    - The tangent line bisects the angle between the focal radii
+    - This property is used in elliptical mirrors and whispering galleries
+    
+    **2. Mathematical Formula**
+    - For ellipse: `x²/a² + y²/b² = 1`
+    - Tangent at point (x₁, y₁): `(x₁·x)/a² + (y₁·y)/b² = 1`
+    - Slope: `m = -(b²x₁)/(a²y₁)`
+    
+    **3. Focal Distance**
+    - Distance between foci: `2c` where `c² = a² - b²`
+    - Sum of distances from any point to both foci = `2a` (constant!)
+    """)
+
+with col2:
+    st.markdown("""
+    **🌍 Real-World Applications:**
+    
+    **🛰️ Satellite Orbits**
+    - Planets orbit in ellipses with the Sun at one focus
+    - Tangent to orbit gives instantaneous velocity direction
+    
+    **🏥 Medical Imaging**
+    - Elliptical reflectors in lithotripsy focus sound waves
+    - Tangent properties ensure precise targeting
+    
+    **🏛️ Architecture**
+    - Whispering galleries use elliptical domes
+    - Sound from one focus reflects to the other focus
+    
+    **🔭 Telescopes**
+    - Elliptical mirrors collect and focus light
+    - Tangent calculations optimize light gathering
+    """)
+
+# Interactive Ellipse Calculator
+st.markdown("""
+### 🧮 Interactive Ellipse Tangent Calculator
+Calculate tangent lines to any ellipse at specified points.
+""")
+
+col1, col2, col3, col4 = st.columns(4)
+with col1:
+    a_ellipse = st.number_input("Semi-major axis (a)", value=3.0, min_value=0.1, step=0.1)
+with col2:
+    b_ellipse = st.number_input("Semi-minor axis (b)", value=2.0, min_value=0.1, step=0.1)
+with col3:
+    x_ellipse_point = st.number_input("x-coordinate", value=1.5, step=0.1)
+with col4:
+    if st.button("🔍 Calculate Ellipse Tangent"):
+        # Point on ellipse, slope and intercept (NaN marks an undefined quantity)
+        y_ellipse_point, slope_ellipse, y_intercept = (
+            float(v) for v in ellipse_tangent(a_ellipse, b_ellipse, x_ellipse_point))
+        if not math.isnan(y_ellipse_point):
+            if not math.isnan(slope_ellipse):
+                # Display results
+                st.success(f"**Point on ellipse:** ({x_ellipse_point:.2f}, {y_ellipse_point:.2f})")
+                st.success(f"**Tangent slope:** {slope_ellipse:.3f}")
+                
+                # Tangent line equation
+                st.success(f"**Tangent equation:** y = {slope_ellipse:.3f}x + {y_intercept:.3f}")
+                
+                # Focal information (foci lie on the longer axis)
+                c_focal = math.sqrt(abs(a_ellipse**2 - b_ellipse**2))
+                if a_ellipse >= b_ellipse:
+                    st.info(f"**Foci located at:** (±{c_focal:.2f}, 0)")
+                    major_label, major = "2a", a_ellipse
+                else:
+                    st.info(f"**Foci located at:** (0, ±{c_focal:.2f})")
+                    major_label, major = "2b", b_ellipse
+                
+                # Distance to foci
+                focal_sum = float(focal_distance_error(a_ellipse, b_ellipse, x_ellipse_point, y_ellipse_point)) + 2*major
+                st.info(f"**Sum of focal distances:** {focal_sum:.2f} (should equal {major_label} = {2*major})")
+            else:
+                st.warning("Point is on the major axis - tangent is vertical")
+        else:
+            st.error("Point is outside the ellipse. Choose a smaller x-value.")
+
+# Ellipse vs Circle Comparison
+st.markdown("""
+### ⚖️ Ellipse vs Circle Tangency Comparison
+""")
+
+comparison_data = {
+    "Property": [
+        "Basic Equation",
+        "Tangent Formula",
+        "Slope Formula", 
+        "Focal Points",
+        "Reflection Property",
+        "Applications"
+    ],
+    "Circle": [
+        "x² + y² = r²",
+        "xx₁ + yy₁ = r²",
+        "m = -x₁/y₁",
+        "One center point",
+        "Angle of incidence = Angle of reflection",
+        "Radar dishes, mirrors"
+    ],
+    "Ellipse": [
+        "x²/a² + y²/b² = 1",
+        "(x₁x)/a² + (y₁y)/b² = 1",
+        "m = -(b²x₁)/(a²y₁)",
+        "Two foci (±c, 0)",
+        "Ray from one focus → other focus",
+        "Planetary orbits, medical devices"
+    ]
+}
+
+df_comparison = pd.DataFrame(comparison_data)
+st.table(df_comparison)
+
+# Ellipse Practice Problems
+st.markdown("""
+### 📝 Ellipse Tangency Practice Problems
+
+**🔸 Basic Level:**
+1. Find the tangent to ellipse x²/25 + y²/9 = 1 at point (4, 9/5)
+2. What is the slope of the tangent to x²/16 + y²/4 = 1 at x = 2?
+3. Where are the foci of the ellipse x²/36 + y²/16 = 1?
+
+**🔸 Intermediate Level:**
+4. Find all points on x²/9 + y²/4 = 1 where the tangent has slope -1/2
+5. Show that the tangent to an ellipse at any point bisects the angle between focal radii
+6. Find the equation of the normal line to x²/25 + y²/16 = 1 at point (3, 16/5)
+
+**🔸 Advanced Level:**
+7. Prove that the product of the distances from the foci to any tangent line is constant
+8. Find the envelope of all tangent lines to an ellipse (hint: it's another ellipse!)
+9. Application: A satellite in elliptical orbit - find velocity direction at aphelion
+""")
+
+# Interactive Challenge
+st.markdown("""
+### 🎯 Ellipse Challenge: Whispering Gallery
+""")
+
+st.markdown("""
+**Scenario:** You're designing a whispering gallery with an elliptical dome. A person stands at one focus 
+and whispers. Where should the listener stand to hear the whisper most clearly?
+""")
+
+challenge_answer = st.radio(
+    "Where should the listener stand?",
+    [
+        "At the center of the ellipse",
+        "At the other focus",
+        "Anywhere on the ellipse",
+        "At the vertex of the ellipse"
+    ],
+    key="ellipse_challenge"
+)
+
+if st.button("🔍 Check Challenge Answer"):
+    if challenge_answer == "At the other focus":
+        st.balloons()
+        st.success("""
+        🎉 Correct! The listener should stand at the **other focus**!
+        
+        **Explanation:** Due to the reflection property of ellipses, sound waves from one focus 
+        will reflect off the elliptical surface and converge at the other focus. This is why 
+        whispering galleries work - the tangent line at any point on the ellipse bisects the 
+        angle between the lines connecting that point to the two foci.
+        
+        **Famous Examples:**
+        - St. Paul's Cathedral, London
+        - The Capitol Building, Washington D.C.
+        - Grand Central Terminal, New York
+        """)
+    else:
+        st.error(f"""
+        ❌ Not quite! You selected "{challenge_answer}".
+        
+        Think about the reflection property: tangent lines to an ellipse have a special 
+        relationship with the two focal points. Sound from one focus reflects to where?
+        """)
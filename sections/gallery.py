@@ -0,0 +1,47 @@
+# gallery.py
+import streamlit as st
+from image_pipeline import load_gallery, render_figure, publish_gallery, picture_html
+
+@st.cache_data
+def generate_tangency_images():
+    """Gallery variants from the deploy-time export, rendered here only if it is missing or stale"""
+    images = load_gallery()
+    if images is None:
+        # Only this fallback needs matplotlib and the figure code
+        from figures import GALLERY_FIGURES
+        images = {name: render_figure(build) for name, build in GALLERY_FIGURES.items()}
+        publish_gallery(images)
+    return images
+
+def gallery_image(images, name, caption):
+    """Show a gallery figure; the browser picks width and format from the srcset"""
+    st.markdown(picture_html(name, images[name], caption), unsafe_allow_html=True)
+
+# Visual Gallery
+st.markdown("""
+### 🖼️ Visual Gallery: Types of Tangency
+""")
+
+try:
+    tangency_images = generate_tangency_images()
+    
+    col1, col2 = st.columns(2)
+    with col1:
+        gallery_image(tangency_images, 'tangent_line', "Basic Tangent Line")
+        st.markdown("**Concept:** Tangent line touches parabola at one point with matching slope")
+        
+        gallery_image(tangency_images, 'derivative', "Function vs Derivative")
+        st.markdown("**Concept:** Derivative gives slope of tangent at each point")
+    
+    with col2:
+        gallery_image(tangency_images, 'circle_tangent', "Circle Tangent")
+        st.markdown("**Concept:** Tangent to circle is perpendicular to radius at point of contact")
+        
+        gallery_image(tangency_images, 'normal_line', "Tangent vs Normal")
+        st.markdown("**Concept:** Normal line is perpendicular to tangent line")
+        
+        gallery_image(tangency_images, 'ellipse_tangent', "Ellipse Tangent")
+        st.markdown("**Concept:** Ellipse tangent reflects between foci with equal angles")
+        
+except Exception as e:
+    st.error(f"Error generating images: {e}")
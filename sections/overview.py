@@ -0,0 +1,52 @@
+# overview.py
+import streamlit as st
+
+# Header
+st.markdown("""
+    <div style="background: linear-gradient(to right, #667eea, #764ba2); padding: 30px; text-align: center;">
+        <h1 style="color: white; margin-bottom: 5px;">
+            📐 Advanced Tangency & Derivatives
+        </h1>
+        <div style="color: #f0f0f0; font-style: italic; font-size: 1.1rem;">
+            From Geometric Tangent Lines to Calculus Applications
+        </div>
+    </div>
+""", unsafe_allow_html=True)
+
+# Description
+st.markdown("""
+<div style="background-color: #2c3e50; color: white; padding: 20px; font-size: 1rem;">
+This comprehensive application explores tangency from multiple mathematical perspectives: geometric tangent lines to circles, 
+calculus derivatives as slopes of tangent lines, normal lines, and real-world applications in physics and engineering. 
+Students will discover how tangency connects algebra, geometry, and calculus through interactive visualizations and activities.
+</div>
+""", unsafe_allow_html=True)
+
+# Learning Objectives
+st.markdown("""
+### 🎯 Learning Objectives
+- Understand tangent lines as lines that touch curves at exactly one point
+- Connect derivatives to slopes of tangent lines
+- Distinguish between tangent lines and normal lines
+- Apply tangency concepts to real-world problems
+- Master the relationship between geometric and algebraic approaches
+
+**Standards Alignment:**
+- HSF.IF.B.4 – Interpret key features of graphs and tables
+- HSA.CED.A.2 – Create equations in two or more variables to represent relationships
+- HSF.IF.C.7 – Graph functions and analyze key features
+- Calculus: Understanding derivatives as rates of change and slopes
+
+---
+
+### 📝 Key Concepts & Formulas
+
+**Tangent Line:** A line that touches a curve at exactly one point and has the same slope as the curve at that point.
+
+**Key Formulas:**
+- **Point-Slope Form:** `y - y₁ = m(x - x₁)` where m is the slope at point (x₁, y₁)
+- **Derivative as Slope:** `m = f'(x₁)` at point x₁
+- **Normal Line Slope:** `m_normal = -1/m_tangent` (negative reciprocal)
+- **Circle Tangent:** For circle x² + y² = r², tangent at (a,b) has slope `m = -a/b`
+- **Ellipse Tangent:** For ellipse x²/A² + y²/B² = 1, tangent at (x₁,y₁) has slope `m = -(B²x₁)/(A²y₁)`
+""")
@@ -0,0 +1,109 @@
+# problem_solver.py
+import streamlit as st
+
+# Concept Matching Activity
+st.markdown("""
+### 🎯 Concept Matching Challenge
+Match each tangency concept with its correct description and application.
+""")
+
+col1, col2, col3 = st.columns(3)
+with col1:
+    concept = st.selectbox("🔸 Select Concept", [
+        "Tangent Line", 
+        "Normal Line", 
+        "Derivative", 
+        "Circle Tangent",
+        "Rate of Change"
+    ])
+
+with col2:
+    description = st.selectbox("📖 Match Description", [
+        "Line perpendicular to tangent",
+        "Instantaneous rate of change",
+        "Line touching curve at one point",
+        "Perpendicular to radius at contact point",
+        "How fast something changes"
+    ])
+
+with col3:
+    application = st.selectbox("🌍 Real-World Application", [
+        "Satellite dish design",
+        "Roller coaster safety",
+        "Speed at specific moment",
+        "Perpendicular parking",
+        "Velocity calculations"
+    ])
+
+if st.button("✅ Check Concept Match"):
+    # Define correct matches
+    correct_matches = {
+        "Tangent Line": ("Line touching curve at one point", "Roller coaster safety"),
+        "Normal Line": ("Line perpendicular to tangent", "Perpendicular parking"),
+        "Derivative": ("Instantaneous rate of change", "Velocity calculations"),
+        "Circle Tangent": ("Perpendicular to radius at contact point", "Satellite dish design"),
+        "Rate of Change": ("How fast something changes", "Speed at specific moment")
+    }
+    
+    if concept in correct_matches:
+        correct_desc, correct_app = correct_matches[concept]
+        if description == correct_desc and application == correct_app:
+            st.balloons()
+            st.success("🎉 Perfect Match! You understand the concepts!")
+        else:
+            st.warning(f"Close! For {concept}: Description should be '{correct_desc}' and Application should be '{correct_app}'")
+
+# Advanced Problem Solver
+st.markdown("""
+### 🔬 Advanced Problem Solver
+Solve complex tangency problems step-by-step.
+""")
+
+problem_type = st.selectbox("Choose Problem Type", [
+    "Find where two curves have parallel tangents",
+    "Find tangent line equation",
+    "Find normal line equation",
+    "Circle tangent from external point"
+])
+
+if problem_type == "Find tangent line equation":
+    st.markdown("**Problem:** Given f(x) = x³ - 2x² + x + 1, find the tangent line at x = 2")
+    
+    if st.button("👀 Show Solution Steps"):
+        st.markdown("""
+        **Step 1:** Find the y-coordinate
+        - f(2) = 2³ - 2(2²) + 2 + 1 = 8 - 8 + 2 + 1 = 3
+        - Point: (2, 3)
+        
+        **Step 2:** Find the derivative
+        - f'(x) = 3x² - 4x + 1
+        
+        **Step 3:** Find slope at x = 2
+        - f'(2) = 3(4) - 4(2) + 1 = 12 - 8 + 1 = 5
+        
+        **Step 4:** Use point-slope form
+        - y - 3 = 5(x - 2)
+        - y = 5x - 7
+        
+        **Answer:** The tangent line is y = 5x - 7
+        """)
+
+elif problem_type == "Find normal line equation":
+    st.markdown("**Problem:** Find the normal line to y = x² at the point (3, 9)")
+    
+    if st.button("👀 Show Solution Steps"):
+        st.markdown("""
+        **Step 1:** Find the slope of tangent
+        - f(x) = x², so f'(x) = 2x
+        - At x = 3: f'(3) = 2(3) = 6
+        
+        **Step 2:** Find slope of normal
+        - m_normal = -1/m_tangent = -1/6
+        
+        **Step 3:** Use point-slope form with (3, 9)
+        - y - 9 = -1/6(x - 3)
+        - y = -1/6 x + 1/2 + 9
+        - y = -1/6 x + 19/2
+        
+        **Answer:** The normal line is y = -1/6 x + 19/2
+        """)
@@ -0,0 +1,109 @@
+# quiz.py
+import streamlit as st
+
+# Add to existing quiz section
+st.markdown("""
+### 🎮 Extended Quiz: Including Ellipse Tangency
+""")
+
+st.markdown("**Question 1:** What is the slope of the tangent to f(x) = x³ at x = 2?")
+q1_answer = st.radio(
+    "Select your answer:",
+    ["6", "8", "12", "3"],
+    key="tq1"
+)
+
+st.markdown("**Question 2:** The tangent at a point has slope 4. What is the slope of the normal line?")
+q2_answer = st.radio(
+    "Select your answer:",
+    ["4", "-4", "1/4", "-1/4"],
+    key="tq2"
+)
+
+st.markdown("**Question 3:** What is the slope of the tangent to x² + y² = 25 at the point (3, 4)?")
+q3_answer = st.radio(
+    "Select your answer:",
+    ["3/4", "-3/4", "4/3", "-4/3"],
+    key="tq3"
+)
+
+st.markdown("**Question 4:** What does the derivative f'(a) tell you about the graph of f?")
+q4_answer = st.radio(
+    "Select your answer:",
+    ["Area under the curve", "Slope of tangent line", "y-intercept of the curve", "Length of the curve"],
+    key="tq4"
+)
+
+st.markdown("**Question 5:** On a position-time graph, what does the slope of the tangent represent?")
+q5_answer = st.radio(
+    "Select your answer:",
+    ["Average velocity", "Instantaneous velocity", "Acceleration", "Total distance"],
+    key="tq5"
+)
+
+# Additional ellipse question
+st.markdown("**Question 6:** For ellipse x²/9 + y²/4 = 1, what is the slope of the tangent at point (3cos(π/6), 2sin(π/6))?")
+q6_answer = st.radio(
+    "Select your answer:",
+    ["-√3/3", "-√3", "-2√3/3", "-3/√3"],
+    key="tq6"
+)
+
+# Update the quiz submission section
+if st.button("📊 Submit Extended Tangency Quiz"):
+    score = 0
+    total_questions = 6  # Updated to include ellipse question
+    
+    if q1_answer == "12":
+        score += 1
+        st.success("✅ Question 1: Correct! f'(x) = 3x², so f'(2) = 3(4) = 12")
+    else:
+        st.error(f"❌ Question 1: You selected {q1_answer}. Correct answer: 12 (derivative of x³ is 3x²)")
+    
+    if q2_answer == "-1/4":
+        score += 1
+        st.success("✅ Question 2: Correct! Normal slope = -1/tangent slope = -1/4")
+    else:
+        st.error(f"❌ Question 2: You selected {q2_answer}. Correct answer: -1/4 (negative reciprocal)")
+    
+    if q3_answer == "-3/4":
+        score += 1
+        st.success("✅ Question 3: Correct! For x² + y² = r², slope = -x/y = -3/4")
+    else:
+        st.error(f"❌ Question 3: You selected {q3_answer}. Correct answer: -3/4 (tangent perpendicular to radius)")
+    
+    if q4_answer == "Slope of tangent line":
+        score += 1
+        st.success("✅ Question 4: Correct! The derivative gives the slope of the tangent line")
+    else:
+        st.error(f"❌ Question 4: You selected {q4_answer}. Correct answer: Slope of tangent line")
+    
+    if q5_answer == "Instantaneous velocity":
+        score += 1
+        st.success("✅ Question 5: Correct! Tangent to position graph shows instantaneous velocity")
+    else:
+        st.error(f"❌ Question 5: You selected {q5_answer}. Correct answer: Instantaneous velocity")
+    
+    # New ellipse question
+    if q6_answer == "-2√3/3":
+        score += 1
+        st.success("✅ Question 6: Correct! At point (3√3/2, 1), slope = -(4·3√3/2)/(9·1) = -2√3/3")
+    else:
+        st.error(f"❌ Question 6: You selected {q6_answer}. Correct answer: -2√3/3 (use ellipse slope formula)")
+    
+    # Final score
+    percentage = (score / total_questions) * 100
+    if percentage >= 83:  # Adjusted for 6 questions
+        st.balloons()
+        st.success(f"🏆 Outstanding! You scored {score}/{total_questions} ({percentage:.0f}%) - You've mastered tangency!")
+    elif percentage >= 67:  # Adjusted threshold
+        st.info(f"📈 Good work! You scored {score}/{total_questions} ({percentage:.0f}%) - Review key concepts and try again!")
+    else:
+        st.warning(f"📚 You scored {score}/{total_questions} ({percentage:.0f}%) - Study the material above and retake the quiz.")
+
+# Reset Quiz (updated)
+if st.button("🔄 Reset Extended Quiz"):
+    for key in ['tq1', 'tq2', 'tq3', 'tq4', 'tq5', 'tq6']:
+        if key in st.session_state:
+            del st.session_state[key]
+    st.success("Quiz reset! Scroll up to retake the quiz.")
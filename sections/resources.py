@@ -0,0 +1,77 @@
+# resources.py
+import streamlit as st
+
+# Real-World Applications
+st.markdown("""
+### 🌍 Real-World Applications of Tangency
+
+**🚗 Automotive Engineering**
+- Car headlight reflectors use parabolic shapes where tangent lines help focus light beams
+- Suspension systems use tangent calculations for optimal comfort and safety
+
+**🛰️ Aerospace & Satellites**
+- Satellite dish positioning requires precise tangent line calculations
+- Rocket trajectory optimization uses tangent concepts for fuel efficiency
+
+**🎢 Architecture & Construction**
+- Roller coaster design ensures smooth transitions using tangent lines
+- Bridge cable tensions calculated using tangent and normal forces
+
+**📱 Technology**
+- Smartphone screen curvature designed using tangent principles
+- GPS navigation uses tangent calculations for shortest path algorithms
+
+**⚡ Physics & Engineering**
+- Electric field lines are always tangent to equipotential surfaces
+- Velocity vectors are tangent to motion paths
+""")
+
+# Practice Problems
+st.markdown("""
+### 📝 Additional Practice Problems
+
+**Problem Set A: Basic Tangent Lines**
+1. Find the tangent line to y = 2x² - 3x + 1 at x = 1
+2. Where does y = x³ have a horizontal tangent line?
+3. Find the normal line to y = √x at x = 4
+
+**Problem Set B: Circle Tangency**
+1. Find the tangent to x² + y² = 13 at point (2, 3)
+2. Find all tangent lines to x² + y² = 5 with slope = 2
+3. Find the tangent from external point (5, 0) to circle x² + y² = 9
+
+**Problem Set C: Applications**
+1. A ball is thrown with height h(t) = -16t² + 32t + 6. Find its velocity at t = 1
+2. Find the angle between two curves y = x² and y = x³ at their intersection
+3. Design a parabolic mirror: find the tangent at any point on y = x²/4
+""")
+
+# Resources and References
+st.markdown("""
+### 📚 Study Resources & References
+
+**📖 Textbook Resources**
+- [Khan Academy - Derivatives as Slopes](https://www.khanacademy.org/math/ap-calculus-ab/ab-derivative-intro)
+- [Paul's Online Math Notes - Tangent Lines](https://tutorial.math.lamar.edu/Classes/CalcI/TangentLines.aspx)
+- [MIT OpenCourseWare - Single Variable Calculus](https://ocw.mit.edu/courses/mathematics/18-01-single-variable-calculus-fall-2006/)
+
+**🎥 Video Tutorials**
+- [YouTube: Tangent Lines and Derivatives](https://www.youtube.com/watch?v=pQa_tWZmlGs)
+- [Professor Leonard - Tangent and Normal Lines](https://www.youtube.com/watch?v=Qp8QUVOduro)
+- [Khan Academy - Introduction to Derivatives](https://www.youtube.com/watch?v=5yfh5cf4-0w)
+
+**🔧 Interactive Tools**
+- [Desmos Graphing Calculator](https://www.desmos.com/calculator)
+- [GeoGebra Calculus Tools](https://www.geogebra.org/graphing)
+- [Wolfram Alpha Derivative Calculator](https://www.wolframalpha.com/)
+
+**📱 Mobile Apps**
+- Photomath (for step-by-step solutions)
+- Calculus Tools (derivative practice)
+- GeoGebra Mobile (graphing and visualization)
+
+---
+
+<center>Built by Xavier Honablue M.Ed for CognitiveCloud.ai</center>
+<center>Advanced Mathematics Education • Calculus & Geometry Integration</center>
+""")
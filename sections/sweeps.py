@@ -0,0 +1,72 @@
+# sweeps.py
+import streamlit as st
+import matplotlib.pyplot as plt
+import numpy as np
+import os
+from figures import sweep_figure
+from sweep import Axis, SweepSpec, PARAMETERS, QUANTITIES, STATISTICS, cached_sweep, default_spec
+
+# A result can reach ~100 MB (MAX_HEATMAP_CELLS), so keep only the latest few in memory;
+# older specs are reloaded from the disk cache
+@st.cache_data(show_spinner=False, max_entries=4)
+def sweep_explorer_result(spec, _workers=1):
+    """Sweep results cached per grid spec (the worker count does not change the result)"""
+    return cached_sweep(spec, _workers)
+
+# Parameter-Sweep Explorer
+st.markdown("""
+### 🗺️ Parameter-Sweep Explorer
+Sweep whole ranges of parameters at once instead of one point at a time. Each heatmap cell
+summarizes every value of the parameters that are not on the heatmap axes.
+""")
+
+sweep_kind = st.selectbox("Curve to sweep", [
+    "Ellipse: x²/a² + y²/b² = 1",
+    "Quadratic: f(x) = ax² + bx + c"
+], key="sweep_kind")
+kind = 'ellipse' if sweep_kind.startswith("Ellipse") else 'quadratic'
+
+sweep_axes = []
+for col, axis in zip(st.columns(len(PARAMETERS[kind])), default_spec(kind).axes):
+    with col:
+        start = st.number_input(f"{axis.name} from", value=axis.start, step=0.5, key=f"sweep_{kind}_{axis.name}_start")
+        stop = st.number_input(f"{axis.name} to", value=axis.stop, step=0.5, key=f"sweep_{kind}_{axis.name}_stop")
+        num = st.number_input(f"{axis.name} steps", value=axis.num, min_value=1, max_value=10000, step=10,
+                              key=f"sweep_{kind}_{axis.name}_num")
+        sweep_axes.append(Axis(axis.name, start, stop, int(num)))
+
+col1, col2, col3, col4 = st.columns(4)
+with col1:
+    sweep_rows = st.selectbox("Heatmap rows", PARAMETERS[kind], key=f"sweep_{kind}_rows")
+with col2:
+    col_options = [name for name in PARAMETERS[kind] if name != sweep_rows]
+    sweep_cols = st.selectbox("Heatmap columns", col_options, index=len(col_options) - 1, key=f"sweep_{kind}_cols")
+with col3:
+    sweep_quantity = st.selectbox("Quantity", QUANTITIES[kind], key=f"sweep_{kind}_quantity")
+with col4:
+    sweep_statistic = st.selectbox("Reduce other parameters by", STATISTICS, key="sweep_statistic")
+
+try:
+    sweep_spec = SweepSpec(kind, tuple(sweep_axes), sweep_rows, sweep_cols)
+except ValueError as e:
+    sweep_spec = None
+    st.error(f"Reduce the number of steps: {e}")
+sweep_view = st.radio("View", ["Heatmap", "Surface"], horizontal=True, key="sweep_view")
+use_all_cores = st.checkbox(f"Spread evaluation across all {os.cpu_count()} cores", key="sweep_all_cores")
+if sweep_spec is not None:
+    st.caption(f"Grid size: {sweep_spec.cells:,} cells, evaluated in fixed-size chunks")
+
+if st.button("🗺️ Run Sweep", disabled=sweep_spec is None):
+    with st.spinner("Sweeping parameter grid..."):
+        sweep_result = sweep_explorer_result(sweep_spec, os.cpu_count() if use_all_cores else 1)
+
+    fig = sweep_figure(sweep_result, sweep_quantity, sweep_statistic, surface=sweep_view == "Surface")
+    st.pyplot(fig)
+    plt.close(fig)
+
+    st.info(f"**Evaluated:** {sweep_spec.cells:,} cells — "
+            f"{sweep_quantity} defined in {100 * sweep_result.valid_fraction(sweep_quantity):.1f}% of cells")
+    if kind == 'ellipse' and sweep_result.valid_fraction('focal_error') > 0:
+        focal_error = np.nanmax(np.abs([sweep_result.statistic('focal_error', 'min'),
+                                        sweep_result.statistic('focal_error', 'max')]))
+        st.info(f"**Focal check:** largest |dist1 + dist2 - 2·max(a, b)| over the grid is {focal_error:.2e}")
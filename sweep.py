@@ -0,0 +1,308 @@
+# sweep.py
+"""Chunked parameter sweeps over the ellipse and quadratic tangent formulas.
+
+A sweep evaluates every cell of a parameter grid but only keeps per-cell
+statistics for a two-parameter heatmap (the remaining parameters are reduced
+to mean/min/max), so memory stays fixed at O(chunk + heatmap) no matter how
+many cells the grid has.
+
+Usage: python sweep.py --kind ellipse --workers 4   (≈10⁸ cells; --num sets values per parameter)
+"""
+import argparse
+import functools
+import hashlib
+import inspect
+import math
+import os
+import tempfile
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+
+import numpy as np
+
+import tangency_math
+from tangency_math import quadratic_tangent, ellipse_tangent, focal_distance_error
+
+# Parameters per sweep kind, in grid order
+PARAMETERS = {
+    'ellipse': ('a', 'b', 'x'),
+    'quadratic': ('a', 'b', 'c', 'x'),
+}
+
+# Quantities produced per sweep kind
+QUANTITIES = {
+    'ellipse': ('slope', 'intercept', 'focal_error'),
+    'quadratic': ('y', 'slope', 'intercept'),
+}
+
+STATISTICS = ('mean', 'min', 'max')
+
+# Cells evaluated per chunk; temporaries stay around 50 MB whatever the grid size
+CHUNK_CELLS = 1 << 18
+
+# Largest grid a sweep may evaluate (≈20 s on one core) and largest heatmap it may keep
+# (3 quantities × 4 float64 statistics × 10⁶ cells ≈ 100 MB)
+MAX_CELLS = 10**8
+MAX_HEATMAP_CELLS = 10**6
+
+DEFAULT_CACHE_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.sweep_cache')
+
+# Bump when the .npz layout changes; formula changes are picked up from the source hash
+CACHE_FORMAT = 1
+# Oldest (least recently used) results are evicted beyond this many files
+MAX_CACHE_FILES = 64
+
+# Values per parameter for the command-line benchmark, ≈10⁸ cells for either kind
+BENCHMARK_NUM = {'ellipse': 464, 'quadratic': 100}
+
+
+@dataclass(frozen=True)
+class Axis:
+    """Evenly spaced values for one parameter"""
+    name: str
+    start: float
+    stop: float
+    num: int
+
+    def values(self):
+        return np.linspace(self.start, self.stop, self.num)
+
+
+@dataclass(frozen=True)
+class SweepSpec:
+    """A full parameter grid plus the two parameters kept as heatmap axes"""
+    kind: str
+    axes: tuple
+    rows: str
+    cols: str
+
+    def __post_init__(self):
+        if self.kind not in PARAMETERS:
+            raise ValueError(f"Unknown sweep kind '{self.kind}'")
+        if tuple(axis.name for axis in self.axes) != PARAMETERS[self.kind]:
+            raise ValueError(f"{self.kind} sweeps need axes {PARAMETERS[self.kind]}")
+        if any(axis.num < 1 for axis in self.axes):
+            raise ValueError("Every axis needs at least one value")
+        if self.rows == self.cols or {self.rows, self.cols} - set(PARAMETERS[self.kind]):
+            raise ValueError("Heatmap rows and columns must be two different sweep parameters")
+        if self.cells > MAX_CELLS:
+            raise ValueError(f"Grid has {self.cells:,} cells; the limit is {MAX_CELLS:,}")
+        rows, cols = self.heatmap_shape
+        if rows * cols > MAX_HEATMAP_CELLS:
+            raise ValueError(f"Heatmap has {rows * cols:,} cells; the limit is {MAX_HEATMAP_CELLS:,}")
+
+    def axis(self, name):
+        return self.axes[PARAMETERS[self.kind].index(name)]
+
+    @property
+    def order(self):
+        """Parameter names with the heatmap axes first, so each heatmap cell is a contiguous block"""
+        inner = tuple(name for name in PARAMETERS[self.kind] if name not in (self.rows, self.cols))
+        return (self.rows, self.cols) + inner
+
+    @property
+    def shape(self):
+        return tuple(self.axis(name).num for name in self.order)
+
+    @property
+    def heatmap_shape(self):
+        return self.shape[:2]
+
+    @property
+    def cells(self):
+        return math.prod(self.shape)
+
+    @property
+    def digest(self):
+        """Key for the on-disk cache; changes with the spec, the cache format or the formulas"""
+        return hashlib.sha256(f"{_cache_salt()}:{self!r}".encode()).hexdigest()[:16]
+
+
+@dataclass
+class SweepResult:
+    """Per-heatmap-cell count/sum/min/max for each quantity, shaped (quantity, rows, cols)"""
+    spec: SweepSpec
+    count: np.ndarray
+    total: np.ndarray
+    low: np.ndarray
+    high: np.ndarray
+    seconds: float = 0.0
+
+    @property
+    def quantities(self):
+        return QUANTITIES[self.spec.kind]
+
+    def statistic(self, quantity, statistic):
+        """Heatmap of one quantity reduced over the inner parameters (NaN where never defined)"""
+        i = self.quantities.index(quantity)
+        if statistic == 'mean':
+            with np.errstate(invalid='ignore', divide='ignore'):
+                return self.total[i] / self.count[i]
+        if statistic == 'min':
+            return self.low[i]
+        if statistic == 'max':
+            return self.high[i]
+        raise ValueError(f"Unknown statistic '{statistic}'")
+
+    def valid_fraction(self, quantity):
+        i = self.quantities.index(quantity)
+        return float(self.count[i].sum()) / self.spec.cells
+
+    def save(self, path):
+        np.savez_compressed(path, count=self.count, total=self.total, low=self.low,
+                            high=self.high, seconds=self.seconds)
+
+    @classmethod
+    def load(cls, spec, path):
+        with np.load(path) as data:
+            return cls(spec, data['count'], data['total'], data['low'], data['high'],
+                       float(data['seconds']))
+
+
+@functools.lru_cache(maxsize=None)
+def _cache_salt():
+    source = inspect.getsource(tangency_math) + inspect.getsource(_evaluate)
+    return f"{CACHE_FORMAT}:{hashlib.sha256(source.encode()).hexdigest()}"
+
+
+def _evaluate(kind, params):
+    """Quantities for one chunk, stacked as (quantity, cells)"""
+    if kind == 'ellipse':
+        a, b, x = params['a'], params['b'], params['x']
+        y, slope, intercept = ellipse_tangent(a, b, x)
+        return np.stack([slope, intercept, focal_distance_error(a, b, x, y)])
+    y, slope, intercept = quadratic_tangent(params['a'], params['b'], params['c'], params['x'])
+    return np.stack([y, slope, intercept])
+
+
+def _sweep_chunk(spec, lo, hi):
+    """Evaluate flat cells [lo, hi) and reduce them onto the heatmap cells they cover"""
+    flat = np.arange(lo, hi, dtype=np.int64)
+    indices = np.unravel_index(flat, spec.shape)
+    params = {name: spec.axis(name).values()[idx] for name, idx in zip(spec.order, indices)}
+    values = _evaluate(spec.kind, params)
+
+    inner = spec.cells // (spec.shape[0] * spec.shape[1])
+    cell = flat // inner
+    first = int(cell[0])
+    # Heatmap cells are contiguous runs in flat order, so reduceat gives per-cell min/max
+    starts = np.flatnonzero(np.r_[True, cell[1:] != cell[:-1]])
+    offsets = cell[starts] - first
+    span = int(cell[-1]) - first + 1
+
+    valid = ~np.isnan(values)
+    count = np.zeros((len(values), span))
+    total = np.zeros((len(values), span))
+    count[:, offsets] = np.add.reduceat(valid, starts, axis=1, dtype=np.int64)
+    total[:, offsets] = np.add.reduceat(np.where(valid, values, 0.0), starts, axis=1)
+    low = np.full((len(values), span), np.nan)
+    high = np.full((len(values), span), np.nan)
+    low[:, offsets] = np.fmin.reduceat(values, starts, axis=1)
+    high[:, offsets] = np.fmax.reduceat(values, starts, axis=1)
+    return first, count, total, low, high
+
+
+def _chunks(cells, chunk_cells):
+    return [(lo, min(lo + chunk_cells, cells)) for lo in range(0, cells, chunk_cells)]
+
+
+def run_sweep(spec, workers=1, chunk_cells=CHUNK_CELLS):
+    """Evaluate every grid cell in fixed-size chunks, optionally across worker processes"""
+    started = time.perf_counter()
+    n_quantities = len(QUANTITIES[spec.kind])
+    n_cells = spec.heatmap_shape[0] * spec.heatmap_shape[1]
+    count = np.zeros((n_quantities, n_cells))
+    total = np.zeros((n_quantities, n_cells))
+    low = np.full((n_quantities, n_cells), np.nan)
+    high = np.full((n_quantities, n_cells), np.nan)
+
+    ranges = _chunks(spec.cells, chunk_cells)
+    if workers > 1 and len(ranges) > 1:
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            partials = executor.map(_sweep_chunk, [spec] * len(ranges), *zip(*ranges))
+            _merge(partials, count, total, low, high)
+    else:
+        _merge((_sweep_chunk(spec, lo, hi) for lo, hi in ranges), count, total, low, high)
+
+    shape = (n_quantities,) + spec.heatmap_shape
+    return SweepResult(spec, count.reshape(shape), total.reshape(shape), low.reshape(shape),
+                       high.reshape(shape), time.perf_counter() - started)
+
+
+def _merge(partials, count, total, low, high):
+    for first, c, t, lo, hi in partials:
+        cells = slice(first, first + c.shape[1])
+        count[:, cells] += c
+        total[:, cells] += t
+        low[:, cells] = np.fmin(low[:, cells], lo)
+        high[:, cells] = np.fmax(high[:, cells], hi)
+
+
+def cached_sweep(spec, workers=1, cache_dir=DEFAULT_CACHE_DIR):
+    """run_sweep backed by an on-disk cache keyed by the grid spec"""
+    path = os.path.join(cache_dir, f"{spec.kind}-{spec.digest}.npz")
+    if os.path.exists(path):
+        try:
+            result = SweepResult.load(spec, path)
+            os.utime(path)
+            return result
+        except (OSError, ValueError, KeyError, zipfile.BadZipFile):
+            pass  # unreadable entry: recompute and overwrite it
+
+    result = run_sweep(spec, workers)
+    os.makedirs(cache_dir, exist_ok=True)
+    # Write beside the target and rename, so readers never see a partial file
+    with tempfile.NamedTemporaryFile(dir=cache_dir, suffix='.tmp', delete=False) as f:
+        result.save(f)
+    os.replace(f.name, path)
+    _evict(cache_dir)
+    return result
+
+
+def _evict(cache_dir, keep=MAX_CACHE_FILES):
+    entries = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith('.npz')]
+    entries.sort(key=os.path.getmtime, reverse=True)
+    for path in entries[keep:]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass  # already removed by a concurrent session
+
+
+def default_spec(kind, num=50):
+    """A sweep around the calculators' default inputs with num values per parameter"""
+    if kind == 'ellipse':
+        axes = (Axis('a', 1.0, 5.0, num), Axis('b', 0.5, 4.0, num), Axis('x', -5.0, 5.0, num))
+    else:
+        axes = (Axis('a', -2.0, 2.0, num), Axis('b', -2.0, 2.0, num),
+                Axis('c', -2.0, 2.0, num), Axis('x', -3.0, 3.0, num))
+    return SweepSpec(kind, axes, 'a', 'x')
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time a chunked tangent sweep")
+    parser.add_argument('--kind', choices=sorted(PARAMETERS), default='ellipse')
+    parser.add_argument('--num', type=int, help="values per parameter (default: 464 for ellipse, 100 for quadratic)")
+    parser.add_argument('--workers', type=int, default=1)
+    args = parser.parse_args()
+
+    try:
+        spec = default_spec(args.kind, BENCHMARK_NUM[args.kind] if args.num is None else args.num)
+    except ValueError as error:
+        parser.error(str(error))
+    result = run_sweep(spec, args.workers)
+    rate = spec.cells / result.seconds
+    print(f"{spec.cells:,} cells in {result.seconds:.1f}s ({rate / 1e6:.1f}M cells/s, {args.workers} worker(s))")
+    try:
+        import resource
+        print(f"Peak RSS: {resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024:.0f} MB")
+    except ImportError:
+        pass
+    for quantity in result.quantities:
+        print(f"{quantity:<12} defined in {100 * result.valid_fraction(quantity):.1f}% of cells")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,52 @@
+# tangency_math.py
+"""Vectorized tangent-line formulas shared by the calculators and the sweep explorer.
+
+Every function accepts scalars or NumPy arrays (broadcast together) and returns
+NaN where a quantity is undefined instead of raising.
+"""
+import numpy as np
+
+
+def quadratic_tangent(a, b, c, x):
+    """Point, slope and y-intercept of the tangent to f(x) = ax² + bx + c"""
+    a, b, c, x = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, b, c, x)))
+    y = a * x**2 + b * x + c
+    slope = 2 * a * x + b
+    intercept = y - slope * x
+    return y, slope, intercept
+
+
+def ellipse_point(a, b, x):
+    """Upper-half y on x²/a² + y²/b² = 1, NaN when x lies outside the ellipse"""
+    a, b, x = (np.asarray(v, dtype=float) for v in (a, b, x))
+    with np.errstate(divide='ignore', invalid='ignore'):
+        discriminant = b**2 * (1 - x**2 / a**2)
+        return np.where(discriminant >= 0, np.sqrt(np.maximum(discriminant, 0)), np.nan)
+
+
+def ellipse_tangent(a, b, x):
+    """Point, slope and y-intercept of the tangent to x²/a² + y²/b² = 1 at the upper-half point
+
+    The slope is NaN where the tangent is vertical (y = 0).
+    """
+    a, b, x = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, b, x)))
+    y = ellipse_point(a, b, x)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        slope = np.where(y != 0, -(b**2 * x) / (a**2 * y), np.nan)
+    intercept = y - slope * x
+    return y, slope, intercept
+
+
+def focal_distance_error(a, b, x, y):
+    """dist1 + dist2 - 2·(major semi-axis) for the point (x, y); zero on the ellipse
+
+    Foci lie on the x-axis when a ≥ b and on the y-axis otherwise.
+    """
+    a, b, x, y = np.broadcast_arrays(*(np.asarray(v, dtype=float) for v in (a, b, x, y)))
+    c = np.sqrt(np.abs(a**2 - b**2))
+    horizontal = a >= b
+    fx = np.where(horizontal, c, 0.0)
+    fy = np.where(horizontal, 0.0, c)
+    dist1 = np.hypot(x - fx, y - fy)
+    dist2 = np.hypot(x + fx, y + fy)
+    return dist1 + dist2 - 2 * np.maximum(a, b)
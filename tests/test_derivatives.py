@@ -0,0 +1,94 @@
+# test_derivatives.py
+import numpy as np
+import pytest
+
+from derivatives import BENCHMARK_FUNCTIONS, central_difference, complex_step, derivative, from_samples, richardson
+
+# An even count keeps linspace off x = 0, where |x|^2.5 is not smooth enough for central differences
+POINTS = np.concatenate([
+    np.linspace(-3, 3, 2000),
+    np.random.default_rng(0).uniform(-3, 3, 2000),
+    np.random.default_rng(1).uniform(-20, 20, 2000),
+])
+
+METHODS = {
+    'central': central_difference,
+    'richardson': richardson,
+    'complex-step': complex_step,
+}
+
+CASES = [
+    pytest.param(function, method, id=f"{method}-{function[0]}")
+    for function in BENCHMARK_FUNCTIONS
+    for method in METHODS
+    if method != 'complex-step' or function[3]
+]
+
+
+@pytest.mark.parametrize("function, method", CASES)
+def test_error_estimate_covers_actual_error(function, method):
+    label, f, exact, complex_ok = function
+    result = METHODS[method](f, POINTS)
+    actual = np.abs(result.value - exact(POINTS))
+    missed = actual > result.error
+    assert not missed.any(), f"{missed.sum()} misses, first at x = {POINTS[missed][0]}"
+
+
+@pytest.mark.parametrize("levels", [2, 3, 4, 6])
+def test_richardson_levels_cover_actual_error(levels):
+    for label, f, exact, complex_ok in BENCHMARK_FUNCTIONS:
+        result = richardson(f, POINTS, levels)
+        assert np.all(np.abs(result.value - exact(POINTS)) <= result.error), label
+
+
+def test_error_estimates_are_not_vacuous():
+    label, f, exact, complex_ok = BENCHMARK_FUNCTIONS[0]
+    assert np.median(central_difference(f, POINTS).error) < 1e-8
+    assert np.median(richardson(f, POINTS).error) < 1e-8
+    assert np.median(complex_step(f, POINTS).error) < 1e-13
+
+
+def test_derivative_keeps_input_shape():
+    label, f, exact, complex_ok = BENCHMARK_FUNCTIONS[0]
+    x = np.linspace(-1, 1, 12).reshape(3, 4)
+    result = derivative(f, x, complex_safe=True)
+    assert result.value.shape == result.error.shape == (3, 4)
+    assert np.allclose(result.value, exact(x))
+
+
+def test_spline_interpolates_samples():
+    x = np.array([0.0, 0.4, 1.0, 1.7, 2.5, 3.0])
+    spline = from_samples(x, np.sin(x))
+    assert np.allclose(spline(x), np.sin(x), rtol=0, atol=1e-15)
+    # Linear data stays linear, so every method recovers the slope inside and beyond the data
+    line = from_samples(x, 2 * x - 1)
+    points = np.linspace(-0.5, 3.5, 41)
+    for method in ('complex-step', 'richardson', 'central'):
+        result = derivative(line, points, method, complex_safe=True)
+        assert np.all(np.abs(result.value - 2) <= result.error), method
+
+
+def test_spline_methods_agree_within_their_errors():
+    x = np.linspace(0, 3, 31)
+    spline = from_samples(x, np.sin(x))
+    points = np.random.default_rng(2).uniform(0, 3, 500)
+    exact = complex_step(spline, points)
+    estimate = richardson(spline, points)
+    assert np.all(np.abs(exact.value - estimate.value) <= exact.error + estimate.error)
+
+
+@pytest.mark.parametrize("x, y", [
+    ([0.0, 1.0], [0.0, 1.0]),
+    ([0.0, 1.0, 1.0], [0.0, 1.0, 2.0]),
+    ([0.0, 2.0, 1.0], [0.0, 1.0, 2.0]),
+    ([0.0, 1.0, 2.0], [0.0, np.nan, 2.0]),
+    ([0.0, 1.0, 2.0], [0.0, 1.0]),
+])
+def test_invalid_samples_raise(x, y):
+    with pytest.raises(ValueError):
+        from_samples(x, y)
+
+
+def test_unknown_method_raises():
+    with pytest.raises(ValueError):
+        derivative(np.sin, [0.0], method='forward')
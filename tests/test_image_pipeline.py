@@ -0,0 +1,99 @@
+# test_image_pipeline.py
+import os
+import re
+
+import pytest
+
+from image_pipeline import (VARIANT_SCALES, ImageVariant, load_gallery, picture_html, publish_gallery,
+                            publish_variants, render_figure, select_variant)
+
+
+def fake_variants(widths=(300, 400, 600), css_width=400, tag=b''):
+    return [ImageVariant(width, mime, f"{mime}:{width}".encode() + tag, css_width)
+            for width in widths for mime in ('image/png', 'image/webp')]
+
+
+@pytest.mark.parametrize("slot, expected", [(1, 300), (300, 300), (301, 400), (400, 400), (599, 600), (2000, 600)])
+def test_select_variant_picks_smallest_wide_enough_then_widest(slot, expected):
+    assert select_variant(fake_variants(), slot).width == expected
+
+
+def test_select_variant_respects_webp_support():
+    variants = fake_variants()
+    assert select_variant(variants, 400).mime == 'image/webp'
+    assert select_variant(variants, 400, accepts_webp=False).mime == 'image/png'
+
+
+def test_filename_depends_only_on_content():
+    a = ImageVariant(400, 'image/webp', b'same bytes', 400)
+    b = ImageVariant(400, 'image/webp', b'same bytes', 400)
+    c = ImageVariant(400, 'image/webp', b'other bytes', 400)
+    assert a.filename('fig') == b.filename('fig')
+    assert a.digest != c.digest
+    assert re.fullmatch(r"fig-400w\.[0-9a-f]{16}\.webp", a.filename('fig'))
+
+
+def test_picture_html_lists_every_width_per_format():
+    variants = fake_variants()
+    markup = picture_html('fig', variants, 'Tangent <b>&</b> "normal"')
+    sources = re.findall(r'<source type="([^"]+)" srcset="([^"]+)"', markup)
+    assert [mime for mime, _ in sources] == ['image/webp', 'image/png']
+    for mime, srcset in sources:
+        described = [int(w) for w in re.findall(r" (\d+)w", srcset)]
+        assert described == [300, 400, 600]
+        for v in variants:
+            if v.mime == mime:
+                assert f"app/static/{v.filename('fig')} {v.width}w" in srcset
+    assert 'min(50vw, 400px)' in markup
+    assert 'Tangent &lt;b&gt;&amp;&lt;/b&gt; &quot;normal&quot;' in markup
+    assert '<b>' not in markup
+
+
+def test_publish_variants_is_idempotent(tmp_path):
+    variants = fake_variants()
+    publish_variants('fig', variants, tmp_path)
+    first = {name: os.stat(tmp_path / name).st_mtime_ns for name in os.listdir(tmp_path)}
+    publish_variants('fig', variants, tmp_path)
+    second = {name: os.stat(tmp_path / name).st_mtime_ns for name in os.listdir(tmp_path)}
+    assert first == second
+    assert sorted(first) == sorted(v.filename('fig') for v in variants)
+
+
+def test_publish_variants_prunes_only_superseded_files_of_that_figure(tmp_path):
+    publish_variants('fig', fake_variants(tag=b'old'), tmp_path)
+    publish_variants('fig_other', fake_variants(tag=b'old'), tmp_path)
+    (tmp_path / 'notes.txt').write_text('keep')
+    current = fake_variants(tag=b'new')
+    publish_variants('fig', current, tmp_path)
+    remaining = set(os.listdir(tmp_path))
+    assert {v.filename('fig') for v in current} <= remaining
+    assert not any(v.filename('fig') in remaining for v in fake_variants(tag=b'old'))
+    assert {v.filename('fig_other') for v in fake_variants(tag=b'old')} <= remaining
+    assert 'notes.txt' in remaining
+
+
+def test_published_gallery_loads_back(tmp_path):
+    images = {'fig': fake_variants(), 'wide': fake_variants((600, 800, 1200), 800)}
+    publish_gallery(images, tmp_path)
+    assert load_gallery(tmp_path) == images
+    os.remove(tmp_path / images['wide'][0].filename('wide'))
+    assert load_gallery(tmp_path) is None
+    assert load_gallery(tmp_path / 'missing') is None
+
+
+def test_render_figure_scales_from_drawn_width():
+    import matplotlib.pyplot as plt
+
+    def build():
+        fig, ax = plt.subplots(figsize=(4, 3))
+        ax.plot([0, 1], [0, 1])
+        return fig
+
+    variants = render_figure(build)
+    css_width = variants[0].css_width
+    assert 300 < css_width < 420
+    widths = sorted({v.width for v in variants})
+    assert len(widths) == len(VARIANT_SCALES)
+    for width, scale in zip(widths, sorted(VARIANT_SCALES)):
+        assert abs(width - scale * css_width) <= 1
+    assert sorted(v.mime for v in variants) == ['image/png'] * 3 + ['image/webp'] * 3
@@ -0,0 +1,88 @@
+# test_pages.py
+import glob
+import os
+
+import pytest
+from streamlit.testing.v1 import AppTest
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+PAGES = sorted(glob.glob(os.path.join(ROOT, 'sections', '*.py')))
+
+# Buttons each page shows on its first run, by label
+BUTTONS = {
+    'calculators.py': ["🔍 Calculate Tangent", "🔢 Estimate Tangent"],
+    'ellipse.py': ["🔍 Calculate Ellipse Tangent", "🔍 Check Challenge Answer"],
+    'gallery.py': [],
+    'overview.py': [],
+    'problem_solver.py': ["✅ Check Concept Match"],
+    'quiz.py': ["📊 Submit Extended Tangency Quiz", "🔄 Reset Extended Quiz"],
+    'resources.py': [],
+    'sweeps.py': ["🗺️ Run Sweep"],
+}
+
+
+def run_page(name):
+    at = AppTest.from_file(os.path.join(ROOT, 'sections', name), default_timeout=120)
+    at.run()
+    assert not at.exception, [e.value for e in at.exception]
+    return at
+
+
+def click(at, label):
+    [button] = [b for b in at.button if b.label == label]
+    button.click().run()
+    assert not at.exception, [e.value for e in at.exception]
+    return at
+
+
+def test_every_page_is_listed():
+    assert sorted(BUTTONS) == [os.path.basename(page) for page in PAGES]
+    with open(os.path.join(ROOT, 'app.py')) as f:
+        entrypoint = f.read()
+    for page in PAGES:
+        assert f'"sections/{os.path.basename(page)}"' in entrypoint
+
+
+@pytest.mark.parametrize("name", sorted(BUTTONS))
+def test_page_runs(name):
+    at = run_page(name)
+    assert sorted(b.label for b in at.button) == sorted(BUTTONS[name])
+
+
+@pytest.mark.parametrize("name, label", [(name, label) for name, labels in BUTTONS.items() for label in labels])
+def test_button_runs(name, label):
+    click(run_page(name), label)
+
+
+def test_gallery_shows_every_figure():
+    at = run_page('gallery.py')
+    pictures = [m.value for m in at.markdown if '<picture>' in m.value]
+    assert len(pictures) == 5
+    assert not at.error
+
+
+def test_sweep_produces_a_figure():
+    at = click(run_page('sweeps.py'), "🗺️ Run Sweep")
+    assert not at.error
+    assert len(at.get('image')) == 1
+
+
+def test_pasted_samples_give_a_tangent():
+    at = run_page('calculators.py')
+    at.selectbox(key="numeric_function").set_value("Pasted (x, y) samples").run()
+    at.text_area(key="numeric_samples").set_value("0, 0\n1, 1\n2, 4\n3, 9").run()
+    at.number_input(key="numeric_x").set_value(1.5).run()
+    click(at, "🔢 Estimate Tangent")
+    assert not at.error
+    assert any("Slope" in s.value for s in at.success)
+
+
+def test_quiz_scores_correct_answers():
+    at = run_page('quiz.py')
+    answers = {'tq1': "12", 'tq2': "-1/4", 'tq3': "-3/4", 'tq4': "Slope of tangent line",
+               'tq5': "Instantaneous velocity", 'tq6': "-2√3/3"}
+    for key, answer in answers.items():
+        at.radio(key=key).set_value(answer)
+    click(at, "📊 Submit Extended Tangency Quiz")
+    assert not at.error
+    assert any("6/6" in s.value for s in at.success)
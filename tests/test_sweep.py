@@ -0,0 +1,70 @@
+# test_sweep.py
+import itertools
+
+import numpy as np
+import pytest
+
+from sweep import Axis, SweepSpec, PARAMETERS, run_sweep, _evaluate
+
+
+def small_spec(kind, rows, cols):
+    """Grid with undefined cells (x outside the ellipse, a < b) and uneven axis lengths"""
+    if kind == 'ellipse':
+        axes = (Axis('a', 0.5, 3.0, 6), Axis('b', 0.5, 2.5, 5), Axis('x', -3.5, 3.5, 7))
+    else:
+        axes = (Axis('a', -2.0, 2.0, 4), Axis('b', -1.0, 1.0, 3),
+                Axis('c', -1.0, 1.0, 5), Axis('x', -2.0, 2.0, 6))
+    return SweepSpec(kind, axes, rows, cols)
+
+
+def brute_force(spec):
+    """Evaluate the whole grid at once and reduce it with NumPy's nan-aware reductions"""
+    grids = np.meshgrid(*(spec.axis(name).values() for name in spec.order), indexing='ij')
+    params = {name: grid.ravel() for name, grid in zip(spec.order, grids)}
+    values = _evaluate(spec.kind, params)
+    rows, cols = spec.heatmap_shape
+    values = values.reshape(len(values), rows, cols, -1)
+    return np.nanmean(values, axis=-1), np.nanmin(values, axis=-1), np.nanmax(values, axis=-1)
+
+
+SPECS = [
+    (kind, rows, cols)
+    for kind in PARAMETERS
+    for rows, cols in itertools.permutations(PARAMETERS[kind], 2)
+]
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+@pytest.mark.parametrize("kind, rows, cols", SPECS)
+@pytest.mark.parametrize("chunk_cells", [1, 7, 50, 10**6])
+def test_chunked_sweep_matches_brute_force(kind, rows, cols, chunk_cells):
+    spec = small_spec(kind, rows, cols)
+    result = run_sweep(spec, chunk_cells=chunk_cells)
+    mean, low, high = brute_force(spec)
+    for i, quantity in enumerate(result.quantities):
+        np.testing.assert_allclose(result.statistic(quantity, 'mean'), mean[i], rtol=1e-12, atol=1e-12)
+        np.testing.assert_array_equal(result.statistic(quantity, 'min'), low[i])
+        np.testing.assert_array_equal(result.statistic(quantity, 'max'), high[i])
+
+
+@pytest.mark.filterwarnings("ignore::RuntimeWarning")
+def test_worker_pool_matches_serial():
+    spec = small_spec('ellipse', 'x', 'b')
+    serial = run_sweep(spec, chunk_cells=11)
+    pooled = run_sweep(spec, workers=2, chunk_cells=11)
+    for name in ('count', 'total', 'low', 'high'):
+        np.testing.assert_array_equal(getattr(pooled, name), getattr(serial, name))
+
+
+def test_sweep_has_undefined_cells():
+    # Guards the NaN paths above: some heatmap cells must be entirely undefined
+    result = run_sweep(small_spec('ellipse', 'a', 'x'))
+    assert np.isnan(result.statistic('slope', 'mean')).any()
+    assert not np.isnan(result.statistic('slope', 'mean')).all()
+
+
+def test_oversized_specs_are_rejected():
+    with pytest.raises(ValueError, match="cells"):
+        SweepSpec('quadratic', tuple(Axis(name, 0, 1, 10000) for name in PARAMETERS['quadratic']), 'a', 'x')
+    with pytest.raises(ValueError, match="Heatmap"):
+        SweepSpec('ellipse', (Axis('a', 1, 2, 2000), Axis('b', 1, 2, 1), Axis('x', 0, 1, 2000)), 'a', 'x')